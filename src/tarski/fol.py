@@ -1,15 +1,17 @@
 
 import copy
 import itertools
-from collections import defaultdict, OrderedDict
+from collections import OrderedDict
 from typing import Union, cast
 
 from . import errors as err
 from .errors import UndefinedElement
-from .syntax import Function, Constant, Variable, Sort, inclusion_closure, Predicate, Interval
+from .syntax import Function, Constant, Variable, Sort, Predicate, Interval
 from .syntax.algebra import Matrix
 from . import modules
 
+_EMPTY: frozenset = frozenset()
+
 
 class FirstOrderLanguage:
     """ A many-sorted first-order language. """
@@ -21,9 +23,20 @@ class FirstOrderLanguage:
         # A mapping between each sort and its single immediate parent
         self.immediate_parent = {}
 
+        # The reverse mapping, between each sort and the list of its immediate children, in order of attachment
+        self.immediate_children = {}
+
         # ancestor_sorts[t] is a set containing all supertypes of sort 't', but NOT 't'
-        self.ancestor_sorts = defaultdict(set)
-        self.indirect_ancestor_sorts = defaultdict(set)
+        # The entries of this and the other sort-indexed tables below are created when the sort is registered
+        self.ancestor_sorts = {}
+        self.indirect_ancestor_sorts = {}
+
+        # _descendant_sorts[t] is the reverse of the above, i.e. the set of all subtypes of sort 't', but NOT 't'
+        self._descendant_sorts = {}
+
+        # The same ancestor relation, packed as bitmasks over sort indices: bit i of _ancestor_masks[t._idx]
+        # is set iff the sort with index i is a strict supertype of 't'. Used for fast subtype checks.
+        self._ancestor_masks = []
 
         self._functions = {}
         self._predicates = {}
@@ -83,24 +96,21 @@ class FirstOrderLanguage:
 
     @property
     def sorts(self):
-        return list(self._sorts.values())
+        return self._sorts.values()
 
     @property
     def predicates(self):
-        return list(self._predicates.values())
+        return self._predicates.values()
 
     @property
     def functions(self):
-        return list(self._functions.values())
+        return self._functions.values()
 
     def _attach_object_sort(self):
         """ The `object` sort, being the root of the sort hierarchy, needs a special treatment"""
         sort = Sort('object', self)
-        self._sorts['object'] = sort
-        self._global_index['object'] = sort
+        self._register_sort(sort)
         self.immediate_parent[sort] = None
-        self.ancestor_sorts[sort] = set()
-        self.indirect_ancestor_sorts[sort] = set()
 
     @property
     def Object(self):
@@ -143,14 +153,26 @@ class FirstOrderLanguage:
         self._check_name_not_defined(sort.name, self._sorts, err.DuplicateSortDefinition)
 
         # Register the sort itself
-        self._sorts[sort.name] = sort
-        self._global_index[sort.name] = sort
+        self._register_sort(sort)
 
         # Register the sort parent
         self.set_parent(sort, parent)
 
         return sort
 
+    def _register_sort(self, sort: Sort):
+        if sort.language is not self or sort._idx is not None:
+            raise err.LanguageError(f'Cannot attach sort "{sort}", which belongs to a different language or has '
+                                    f'already been attached')
+        self._sorts[sort.name] = sort
+        self._global_index[sort.name] = sort
+        self.immediate_children[sort] = []
+        self.ancestor_sorts[sort] = set()
+        self.indirect_ancestor_sorts[sort] = set()
+        self._descendant_sorts[sort] = set()
+        sort._idx = len(self._ancestor_masks)
+        self._ancestor_masks.append(0)
+
     def has_sort(self, name: str):
         return name in self._sorts
 
@@ -179,8 +201,7 @@ class FirstOrderLanguage:
             raise err.SemanticError("Cannot create interval with upper bound is <= than the lower bound")
 
         sort = Interval(name, self, parent.encode, lower_bound, upper_bound)
-        self._sorts[name] = sort
-        self._global_index[name] = sort
+        self._register_sort(sort)
 
         self.set_parent(sort, parent)
 
@@ -189,19 +210,66 @@ class FirstOrderLanguage:
     def variable(self, name: str, sort: Union[Sort, str]):
         """ Create a variable symbol with the specified sort, which can be given as a Sort object or as its name,
         if a Sort with that name has already been registered. """
-        sort = self._retrieve_sort(sort)
-        return Variable(name, sort)
+        if isinstance(sort, Sort) and sort.language is self:
+            return Variable(name, sort)  # Fast path for the most common case, saving the full sort retrieval
+        return Variable(name, self._retrieve_sort(sort))
 
     def set_parent(self, sort: Sort, parent: Sort, overwrite=False):
         if parent.language is not self:
             raise err.LanguageError("Tried to set as parent a sort from a different language")
 
+        if sort.language is not self or sort._idx is None:
+            raise err.LanguageError(f'Tried to set the parent of sort "{sort}", which is not attached to the language')
+
         p = self.immediate_parent.get(sort, None)
         if not overwrite and p is not None:
             raise err.LanguageError(f'Tried to set parent of sort "{sort}", which has already parent {p}')
 
+        if p is parent:
+            return  # Nothing to update, the sort hierarchy already contains this very same edge
+
+        if parent is sort or parent in self._descendant_sorts[sort]:
+            raise err.LanguageError(f'Cannot set {parent} as parent of sort "{sort}", as that would create a cycle')
+
+        if p is not None:
+            self.immediate_children[p].remove(sort)
         self.immediate_parent[sort] = parent
-        self.ancestor_sorts[sort].update(inclusion_closure(parent))
+        self.immediate_children[parent].append(sort)
+
+        anc = self.ancestor_sorts[parent] | {parent}
+        anc_mask = self._ancestor_masks[parent._idx] | (1 << parent._idx)
+
+        if p is None and not self._descendant_sorts[sort]:
+            # The common case of a sort being attached to the hierarchy for the first time (e.g. from `sort()`, or
+            # the builtin arithmetic sorts): as a leaf, it just inherits the closure of its parent, and since no
+            # path between previously existing sorts changes, there is no need to reset any cached search result.
+            self.ancestor_sorts[sort] = anc
+            self._ancestor_masks[sort._idx] = anc_mask
+            for a in anc:
+                self._descendant_sorts[a].add(sort)
+            return
+
+        desc = self._descendant_sorts[sort] | {sort}
+
+        if p is not None:
+            # The sort is being moved to a different parent: detach it, along with all of its descendants, from its
+            # former ancestors. With single inheritance, these are exactly the ancestors of the sort itself.
+            old_anc = set(self.ancestor_sorts[sort])
+            old_mask = self._ancestor_masks[sort._idx]
+            for d in desc:
+                self.ancestor_sorts[d] -= old_anc
+                self._ancestor_masks[d._idx] &= ~old_mask
+            for a in old_anc:
+                self._descendant_sorts[a] -= desc
+
+        # Keep the ancestor relation transitively closed incrementally: the sort and all of its descendants
+        # inherit the ancestors of the new parent, and these learn about their new descendants.
+        for d in desc:
+            self.ancestor_sorts[d] |= anc
+            self._ancestor_masks[d._idx] |= anc_mask
+        for a in anc:
+            self._descendant_sorts[a] |= desc
+
         for s in self.indirect_ancestor_sorts:
             self.indirect_ancestor_sorts[s] = set()
         self.indirect_ancestor_sorts[sort] = set()
@@ -214,22 +282,24 @@ class FirstOrderLanguage:
         Make sure that the given obj is either an object of a certain language type (e.g. sort, predicate, etc.)
         which has been correctly registered with the language, or the name of such an object, and return the object
         """
-        if not isinstance(obj, (str, type_)):
-            raise err.UnexpectedElementType(obj)
-
         if isinstance(obj, type_):
-            if obj.language != self:
+            if obj.language is not self:
                 raise err.LanguageMismatch(obj, obj.language, self)
             return obj
 
-        # obj must be a string, which we take as the name of a language element
-        if type_ not in self._element_containers:
-            raise RuntimeError("Trying to index incorrect type {}".format(type_))
+        if not isinstance(obj, str):
+            raise err.UnexpectedElementType(obj)
 
-        if obj not in self._element_containers[type_]:
-            raise err.UndefinedElement(obj)
+        # obj must be a string, which we take as the name of a language element
+        try:
+            container = self._element_containers[type_]
+        except KeyError:
+            raise RuntimeError("Trying to index incorrect type {}".format(type_)) from None
 
-        return self._element_containers[type_][obj]
+        try:
+            return container[obj]
+        except KeyError:
+            raise err.UndefinedElement(obj) from None
 
     def constant(self, name: str, sort: Union[Sort, str]):
         """ Create a constant symbol with the specified sort, which can be given as a Sort object or as its name,
@@ -237,7 +307,9 @@ class FirstOrderLanguage:
         sort = self._retrieve_sort(sort)
 
         if sort.builtin:
-            if sort.cast(name) is None:
+            # Constant casts literals of Interval sorts itself (raising ValueError if they don't belong to the sort),
+            # so only other builtin sorts need to be checked here.
+            if not isinstance(sort, Interval) and sort.cast(name) is None:
                 raise err.SemanticError(
                     f"Cannot create constant with sort '{sort.name}' from '{name}' of Python type '{type(name)}'")
 
@@ -351,7 +423,9 @@ class FirstOrderLanguage:
     def is_subtype(self, t, st):
         t = self._retrieve_sort(t)
         st = self._retrieve_sort(st)
-        return t == st or self.is_strict_subtype(t, st) or self.connected_in_type_hierarchy(t, st)
+        # The ancestor masks are kept transitively closed and up to date in set_parent, so we can test them directly,
+        # without any search over the hierarchy nor a second retrieval of the sorts through is_strict_subtype
+        return t is st or self._has_ancestor(t, st)
 
     def connected_in_type_hierarchy(self, t_0, t_goal):
         """
@@ -360,15 +434,15 @@ class FirstOrderLanguage:
         :param t_goal:
         :return:
         """
-        if t_goal in self.indirect_ancestor_sorts[t_0]:
+        if t_goal in self.indirect_ancestor_sorts.get(t_0, _EMPTY):
             return True
-        OPEN = [t for t in self.ancestor_sorts[t_0]]
+        OPEN = [t for t in self.ancestor_sorts.get(t_0, _EMPTY)]
         while len(OPEN) != 0:
             t = OPEN.pop()
             if t == t_goal:
                 self.indirect_ancestor_sorts[t_0].add(t_goal)
                 return True
-            for t2 in self.ancestor_sorts[t]:
+            for t2 in self.ancestor_sorts.get(t, _EMPTY):
                 if t2 not in OPEN:
                     OPEN += [t2]
         return False
@@ -376,7 +450,13 @@ class FirstOrderLanguage:
     def is_strict_subtype(self, t, st):
         t = self._retrieve_sort(t)
         st = self._retrieve_sort(st)
-        return st in self.ancestor_sorts[t]
+        return self._has_ancestor(t, st)
+
+    def _has_ancestor(self, t: Sort, st: Sort):
+        """ Check on the ancestor masks whether `st` is a strict supertype of `t`. """
+        if t._idx is None or st._idx is None:
+            return False  # A sort that has not been attached to the language is not part of its hierarchy
+        return bool((self._ancestor_masks[t._idx] >> st._idx) & 1)
 
     def are_vertically_related(self, t1, t2):
         t1 = self._retrieve_sort(t1)
@@ -1,7 +1,9 @@
 from enum import Enum
+from types import MappingProxyType
 
-# A table with the negated counterparts of builtin predicates.
-symbol_complements = {"=": "!=", "!=": "=", "<": ">=", "<=": ">", ">": "<=", ">=": "<"}
+# A table with the negated counterparts of builtin predicates. It is read-only, as other tables derived from it
+# at import time (e.g. _COMPLEMENTS below) would otherwise get out of sync.
+symbol_complements = MappingProxyType({"=": "!=", "!=": "=", "<": ">=", "<=": ">", ">": "<=", ">=": "<"})
 
 
 class BuiltinPredicateSymbol(Enum):
@@ -12,11 +14,26 @@ class BuiltinPredicateSymbol(Enum):
     GT = ">"
     GE = ">="
 
+    _str: str  # The string representation of the symbol, see _cache_string_representations
+
     def __str__(self):
-        return self.value.lower()
+        return self._str
 
     def complement(self):
-        return BuiltinPredicateSymbol(symbol_complements[self.value])
+        return _COMPLEMENTS[self]
+
+
+# The negated counterpart of each builtin predicate symbol, precomputed to avoid the Enum lookup on each call
+_COMPLEMENTS = {m: BuiltinPredicateSymbol(symbol_complements[m.value]) for m in BuiltinPredicateSymbol}
+
+
+def _cache_string_representations(enum):
+    """ Store the (invariant) string representation of each member of the given builtin symbol enum. """
+    for m in enum:
+        m._str = m.value.lower()
+
+
+_cache_string_representations(BuiltinPredicateSymbol)
 
 
 class BuiltinFunctionSymbol(Enum):
@@ -49,8 +66,13 @@ class BuiltinFunctionSymbol(Enum):
     DISCRETE = "discrete"
     POISSON = "poisson"
 
+    _str: str  # The string representation of the symbol, see _cache_string_representations
+
     def __str__(self):
-        return self.value.lower()
+        return self._str
+
+
+_cache_string_representations(BuiltinFunctionSymbol)
 
 
 def is_builtin_predicate(predicate):
@@ -78,46 +100,67 @@ def is_builtin_function(fun):
     return isinstance(fun.symbol, BuiltinFunctionSymbol)
 
 
+_BPS = BuiltinPredicateSymbol
+_BFS = BuiltinFunctionSymbol
+
+# The different groups of builtin symbols, allocated once, as they are requested repeatedly when loading theories
+_EQUALITY_PREDICATES = (_BPS.EQ, _BPS.NE)
+_ARITHMETIC_PREDICATES = (_BPS.LT, _BPS.LE, _BPS.GT, _BPS.GE)
+_ARITHMETIC_BINARY_FUNCTIONS = (_BFS.ADD, _BFS.SUB, _BFS.MUL, _BFS.DIV, _BFS.POW, _BFS.MOD)
+_ARITHMETIC_UNARY_FUNCTIONS = (_BFS.SQRT,)
+_SPECIAL_BINARY_FUNCTIONS = (_BFS.MIN, _BFS.MAX)
+_SPECIAL_UNARY_FUNCTIONS = (_BFS.ABS, _BFS.SIN, _BFS.COS, _BFS.TAN, _BFS.ATAN, _BFS.ASIN, _BFS.EXP, _BFS.LOG,
+                            _BFS.ERF, _BFS.ERFC, _BFS.SGN)
+_RANDOM_BINARY_FUNCTIONS = (_BFS.NORMAL, _BFS.GAMMA)
+_RANDOM_UNARY_FUNCTIONS = ()
+
+
 def get_equality_predicates():
-    return [BuiltinPredicateSymbol.EQ, BuiltinPredicateSymbol.NE]
+    return _EQUALITY_PREDICATES
 
 
 def get_arithmetic_predicates():
-    return [BuiltinPredicateSymbol.LT, BuiltinPredicateSymbol.LE, BuiltinPredicateSymbol.GT, BuiltinPredicateSymbol.GE]
+    return _ARITHMETIC_PREDICATES
 
 
 def get_arithmetic_binary_functions():
-    return [BuiltinFunctionSymbol.ADD, BuiltinFunctionSymbol.SUB, BuiltinFunctionSymbol.MUL, BuiltinFunctionSymbol.DIV,
-            BuiltinFunctionSymbol.POW, BuiltinFunctionSymbol.MOD]
+    return _ARITHMETIC_BINARY_FUNCTIONS
 
 
 def get_arithmetic_unary_functions():
-    return [BuiltinFunctionSymbol.SQRT]
+    return _ARITHMETIC_UNARY_FUNCTIONS
 
 
 def get_special_binary_functions():
-    BFS = BuiltinFunctionSymbol
-    return [BFS.MIN, BFS.MAX]
+    return _SPECIAL_BINARY_FUNCTIONS
 
 
 def get_special_unary_functions():
-    BFS = BuiltinFunctionSymbol
-    return [BFS.ABS, BFS.SIN, BFS.COS, BFS.TAN, BFS.ATAN, BFS.ASIN, BFS.EXP, BFS.LOG, BFS.ERF, BFS.ERFC, BFS.SGN]
+    return _SPECIAL_UNARY_FUNCTIONS
 
 
 def get_random_binary_functions():
-    BFS = BuiltinFunctionSymbol
-    return [BFS.NORMAL, BFS.GAMMA]
+    return _RANDOM_BINARY_FUNCTIONS
 
 
 def get_random_unary_functions():
-    # BFS = BuiltinFunctionSymbol
-    return []
+    return _RANDOM_UNARY_FUNCTIONS
+
+
+# Tables mapping the string representation of each builtin symbol to the symbol itself
+_PREDICATES_BY_SYMBOL = {m.value: m for m in BuiltinPredicateSymbol}
+_FUNCTIONS_BY_SYMBOL = {m.value: m for m in BuiltinFunctionSymbol}
 
 
 def get_predicate_from_symbol(symbol: str):
-    return BuiltinPredicateSymbol(symbol)
+    try:
+        return _PREDICATES_BY_SYMBOL[symbol]
+    except KeyError:
+        raise ValueError(f"'{symbol}' is not a valid BuiltinPredicateSymbol") from None
 
 
 def get_function_from_symbol(symbol: str):
-    return BuiltinFunctionSymbol(symbol)
+    try:
+        return _FUNCTIONS_BY_SYMBOL[symbol]
+    except KeyError:
+        raise ValueError(f"'{symbol}' is not a valid BuiltinFunctionSymbol") from None
@@ -1,5 +1,5 @@
 import itertools
-from typing import Generator, Set
+from typing import Generator, Optional, Set
 
 from .. import errors as err
 
@@ -14,6 +14,8 @@ class Sort:
         self.language = language
         self._domain = set()
         self.builtin = builtin
+        # The index of the sort within its language, assigned by the language upon registration (None until then)
+        self._idx: Optional[int] = None
 
     def __str__(self):
         return 'Sort({})'.format(self.name)
@@ -182,11 +184,8 @@ def ancestors(s: Sort) -> Set[Sort]:
 
 def children(s: Sort) -> Set[Sort]:
     """ Return the direct children of the given sort """
-    result = set()
-    for child, par in s.language.immediate_parent.items():
-        if par is not None and par == s:
-            result.add(child)
-    return result
+    assert s in s.language.immediate_children
+    return set(s.language.immediate_children[s])
 
 
 def int_encode_fn(x):
@@ -28,3 +28,15 @@ def test_namespace_accessor():
         _ = lang.get('foo')
 
 
+def test_sort_retrieval_errors():
+    lang = FirstOrderLanguage()
+    other = FirstOrderLanguage()
+
+    with pytest.raises(errors.UndefinedElement):
+        lang.predicate('on', 'block')
+
+    with pytest.raises(errors.LanguageMismatch):
+        lang.predicate('on', other.Object)
+
+    with pytest.raises(errors.UnexpectedElementType):
+        lang.predicate('on', 3)
@@ -4,9 +4,9 @@ import tarski as tsk
 import tarski.benchmarks.blocksworld
 import tarski.errors as err
 from tarski.benchmarks.counters import generate_fstrips_counters_problem
-from tarski.syntax import symref
+from tarski.syntax import symref, Sort
 from tarski.syntax.ops import compute_sort_id_assignment
-from tarski.syntax.sorts import parent, ancestors, compute_signature_bindings, compute_direct_sort_map
+from tarski.syntax.sorts import parent, ancestors, children, compute_signature_bindings, compute_direct_sort_map
 from tarski.theories import Theory
 
 
@@ -201,3 +201,106 @@ def test_sort_domain_retrieval():
 
     with pytest.raises(err.TarskiError):
         lang.Integer.domain()  # Domain too large to iterate over it
+
+
+def test_subtype_queries_reflect_hierarchy_changes():
+    lang = tsk.fstrips.language()
+    being = lang.sort('being')
+    animal = lang.sort('animal')
+    assert not lang.is_strict_subtype(animal, being)
+
+    # Changing the parent of a sort must not leave stale subtype information behind
+    lang.set_parent(animal, being, overwrite=True)
+    assert lang.is_strict_subtype(animal, being)
+    assert lang.is_subtype(animal, being)
+
+
+def test_reparenting_propagates_to_descendants():
+    lang = tsk.fstrips.language()
+    being = lang.sort('being')
+    animal = lang.sort('animal')
+    human = lang.sort('human', animal)
+
+    lang.set_parent(animal, being, overwrite=True)
+    assert lang.is_strict_subtype(human, being)
+    assert being in ancestors(human)
+    assert not lang.is_subtype(being, human)
+
+
+def test_resetting_same_parent_is_noop():
+    lang, human, animal, being = get_children_parent_types()
+    lang.set_parent(animal, being, overwrite=True)
+    assert parent(animal) == being
+    assert ancestors(human) == {animal, being, lang.Object}
+
+
+def test_children_types():
+    lang, human, animal, being = get_children_parent_types()
+    robot = lang.sort('robot', being)
+    assert children(being) == {animal, robot}
+    assert children(human) == set()
+
+    lang.set_parent(robot, lang.Object, overwrite=True)
+    assert children(being) == {animal}
+    assert robot in children(lang.Object)
+
+
+def test_builtin_constants_from_repeated_literals():
+    lang = tsk.fstrips.language(theories=[Theory.ARITHMETIC])
+    for _ in range(2):
+        assert lang.constant(3, lang.Integer).name == lang.constant("3", lang.Integer).name == 3
+        assert lang.constant(3, lang.Real).name == 3.0
+        with pytest.raises(ValueError):
+            lang.constant(-1, lang.Natural)
+
+
+def test_variable_sort_retrieval():
+    lang, human, _, _ = get_children_parent_types()
+    assert lang.variable('x', human).sort is lang.variable('y', 'human').sort is human
+
+    with pytest.raises(err.LanguageMismatch):
+        lang.variable('z', tsk.fstrips.language().Object)
+
+
+def test_unattached_sorts_are_outside_hierarchy():
+    lang = tsk.fstrips.language(theories=[Theory.ARITHMETIC])
+    ghost = Sort('ghost', lang)
+    assert not lang.is_subtype(ghost, lang.Integer)
+    assert not lang.is_subtype(lang.Natural, ghost)
+    assert not lang.is_strict_subtype(ghost, lang.Object)
+
+    # Sorts of other languages, or already attached ones, cannot be attached
+    with pytest.raises(err.LanguageError):
+        tsk.fstrips.language().attach_sort(ghost, lang.Object)
+    other = tsk.fstrips.language()
+    with pytest.raises(err.LanguageError):
+        lang.attach_sort(other.sort('foo'), lang.Object)
+    # Nor can the parent of unattached or foreign sorts be set
+    with pytest.raises(err.LanguageError):
+        lang.set_parent(ghost, lang.Object)
+    with pytest.raises(err.LanguageError):
+        lang.set_parent(other.get_sort('foo'), lang.Object)
+
+    lang.attach_sort(ghost, lang.Object)
+    assert lang.is_strict_subtype(ghost, lang.Object)
+
+
+def test_reparenting_detaches_from_former_ancestors():
+    lang = tsk.fstrips.language()
+    being = lang.sort('being')
+    robot = lang.sort('robot', being)
+    droid = lang.sort('droid', robot)
+
+    lang.set_parent(robot, lang.Object, overwrite=True)
+    assert children(being) == set()
+    assert not lang.is_subtype(robot, being)
+    assert not lang.is_subtype(droid, being)
+    assert ancestors(droid) == {robot, lang.Object}
+    assert lang.is_strict_subtype(droid, robot)
+
+    # Setting a sort, or any of its descendants, as its parent would create a cycle
+    with pytest.raises(err.LanguageError):
+        lang.set_parent(robot, droid, overwrite=True)
+    with pytest.raises(err.LanguageError):
+        lang.set_parent(robot, robot, overwrite=True)
+    assert not lang.is_strict_subtype(robot, robot)
@@ -394,4 +394,22 @@ def test_equality_and_terms_behaviour():
 
     phi = f(o) == x
 
-    assert isinstance(phi, Atom)
\ No newline at end of file
+    assert isinstance(phi, Atom)
+
+
+def test_builtin_predicate_complements():
+    from tarski.syntax.builtins import BuiltinPredicateSymbol as BPS
+    assert BPS.EQ.complement() is BPS.NE
+    assert BPS.LT.complement() is BPS.GE
+    assert all(s.complement().complement() is s for s in BPS)
+
+
+def test_builtin_symbol_lookup():
+    from tarski.syntax.builtins import BuiltinPredicateSymbol, BuiltinFunctionSymbol, get_predicate_from_symbol, \
+        get_function_from_symbol
+    assert get_predicate_from_symbol("<=") is BuiltinPredicateSymbol.LE
+    assert get_function_from_symbol("sqrt") is BuiltinFunctionSymbol.SQRT
+    with pytest.raises(ValueError):
+        get_predicate_from_symbol("+")
+    with pytest.raises(ValueError):
+        get_function_from_symbol("=")
@@ -0,0 +1,9 @@
+import subprocess
+import sys
+
+
+def test_core_import_does_not_load_optional_packages():
+    # The heavyweight packages of the "arithmetic" extra must only be imported on demand, through tarski.modules
+    code = "import sys, tarski, tarski.fstrips; print(' '.join(m for m in ('numpy', 'scipy') if m in sys.modules))"
+    out = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    assert out.strip() == ""